@@ -10,8 +10,8 @@ class PDFConverter:
         self.pdf_path = pdf_path
         self.logger = logger
         self.pdf = None
-        self.full_text = None
         self.pages = None
+        self.page_texts = []
         self.pages_data_frame=None
     
     def __del__(self):
@@ -25,16 +25,14 @@ class PDFConverter:
         return self.pdf 
 
     def getLazyFullText(self)->str:
-        if not self.full_text:
-            self.full_text = ""
-            pages = self.getLazyPages()
-            if pages:
-                for page in pages:
-                    page_text = page.extract_text() or ""
-                    self.full_text += page_text + "\n"
-            else:
-                return None
-        return self.full_text
+        """
+        Fügt den Volltext aus den zwischengespeicherten Seitentexten zusammen.
+        Er wird nicht zusätzlich gespeichert, die Extraktoren lesen ihn nur einmal.
+        """
+        page_texts = self.getLazyPageTexts()
+        if not page_texts:
+            return None
+        return "".join(page_text + "\n" for page_text in page_texts)
 
     def getLazyPages(self)->[]:
         if self.pages:
@@ -60,16 +58,30 @@ class PDFConverter:
         """Extrahiert den Text aus dem gesamten PDF oder einer begrenzten Anzahl von Seiten."""
         try:
             text = extract_text(self.pdf_path)
-            if self.logger.debug_enabled:
+            if self.logger.is_debug():
                 self.logger.debug(f"File '{self.pdf_path}' converts to:\n{text}")
             return text
         except Exception as e:
             self.logger.warning(f"Could not extract text from '{self.pdf_path}'. Reason: {e}")
             return None
 
-    def getFirstPage(self):
-        """Extrahiert den Text der ersten Seite."""
-        return extract_text(self.pdf_path,maxpages=1)
+    def iterPageTexts(self, maxpages=0):
+        """
+        Liefert den Text Seite für Seite, statt das ganze Dokument auf einmal zu laden.
+        Aufrufer können so abbrechen, sobald sie gefunden haben, was sie suchen.
+        Gelesene Seiten werden zwischengespeichert, damit z.B. die bei der Erkennung
+        der Bank gelesene erste Seite vom Extraktor nicht erneut geparst wird.
+        """
+        pages = self.getLazyPages()
+        if maxpages:
+            pages = pages[:maxpages]
+        for index, page in enumerate(pages):
+            if index == len(self.page_texts):
+                self.page_texts.append(page.extract_text() or "")
+            yield self.page_texts[index]
+
+    def getLazyPageTexts(self)->[]:
+        return list(self.iterPageTexts())
 
     def getStructuredData(self, maxpages=0):
         """Extrahiert strukturierte Daten wie Text und Positionen der Textblöcke."""
@@ -106,7 +118,7 @@ class PDFConverter:
                 
                 structured_data.append(page_data)
 
-            if self.logger.debug_enabled:
+            if self.logger.is_debug():
                 self.logger.debug(f"Structured data for '{self.pdf_path}': {structured_data}")
 
             return structured_data
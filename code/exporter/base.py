@@ -14,7 +14,9 @@ class Exporter:
         )
 
     def get_data_as_dicts(self):
+        # The attributes of each transaction, without internal caches like _dictionary
         return [
-            t.__dict__ for t in self.transactions
+            {key: getattr(t, key) for key in t.__slots__ if not key.startswith("_") and hasattr(t, key)}
+            for t in self.transactions
         ]
         
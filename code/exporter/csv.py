@@ -11,11 +11,11 @@ class CSVExporter(Exporter):
             with open(self.output_file, mode='w', newline='', encoding='utf-8') as file:
                 writer = csv.writer(file)
                 # Get the header keys from the first transaction's dictionary
-                header = list(self.transactions[0].getDictionary().keys())
+                header = list(self.transactions[0].dictionary.keys())
                 writer.writerow(header)
                 # Write each transaction's values in the same order as the header
                 for t in self.transactions:
-                    data = t.getDictionary()
+                    data = t.dictionary
                     row = [data.get(key, "") for key in header]
                     writer.writerow(row)
             self.logger.success(f"CSV file created: {self.output_file}")
@@ -12,6 +12,7 @@ class Extractor:
         transaction.setTransactionId()
         if transaction.isValid():
             self.transactions.append(transaction)
-            self.logger.debug(f"Transaction {transaction} is valid and appended.")
+            if self.logger.is_debug():
+                self.logger.debug(f"Transaction {transaction} is valid and appended.")
         else:
             self.logger.warning(f"This transaction isn't valid:\n{transaction}")
\ No newline at end of file
@@ -39,8 +39,8 @@ class BarclaysPDFExtractor(PDFExtractor):
         builder = BarclaysTransactionBuilder(self.logger, self.source, account_iban)
         
         # Iteriere seitenweise über die Zeilen
-        for page in pages:
-            lines = page.extract_text().splitlines()
+        for page_text in self.pdf_converter.getLazyPageTexts():
+            lines = page_text.splitlines()
             i = 0
             while i < len(lines):
                 line = lines[i].strip()
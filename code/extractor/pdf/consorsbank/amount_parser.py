@@ -1,7 +1,11 @@
 import re
+import numpy as np
+import pandas as pd
 
 class AmountParser:
     """Verarbeitet Beträge und formatiert diese."""
+    # Entfernt Tausenderpunkte und Vorzeichen und macht aus dem Dezimalkomma einen Punkt, alles in einem Durchlauf
+    amount_table = str.maketrans({'.': '', ',': '.', '+': '', '-': ''})
     
     @staticmethod
     def parse_amount(s):
@@ -14,7 +18,7 @@ class AmountParser:
         elif s.endswith('-'):
             sign = -1
         s = s[:-1].strip()  # Entferne das Vorzeichenzeichen
-        s = s.replace('.', '').replace(',', '.')
+        s = s.translate(AmountParser.amount_table)
         print(f"Formatted amount string: {s}")  # Debug-Ausgabe
         try:
             return sign * float(s)
@@ -22,6 +26,19 @@ class AmountParser:
             print(f"Error parsing amount: {e}")  # Debug-Ausgabe
             return None
 
+    @staticmethod
+    def parse_amounts(soll: np.ndarray, haben: np.ndarray) -> np.ndarray:
+        """
+        Wandelt die Soll- und Haben-Spalten vieler Zeilen auf einmal in floats um.
+        Soll wird negativ, Haben positiv. Zeilen ohne oder mit ungültigem Betrag werden NaN.
+        """
+        soll = pd.Series(soll, dtype=str).str.strip()
+        haben = pd.Series(haben, dtype=str).str.strip()
+        is_soll = (soll != "").to_numpy()
+        raw = soll.where(is_soll, haben).str.translate(AmountParser.amount_table)
+        values = pd.to_numeric(raw, errors="coerce").to_numpy(dtype=float)
+        return np.where(is_soll, -values, values)
+
     @staticmethod
     def format_amount(val):
         """Formatiert einen Betrag ins deutsche Format."""
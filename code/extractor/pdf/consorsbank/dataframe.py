@@ -1,17 +1,21 @@
 import pdfplumber
+from contextlib import nullcontext
 import pandas as pd
 from code.logger import Logger
+from code.converter.pdf import PDFConverter
 
 class ConsorbankDataFrame:
-    def __init__(self, pdf_path:str, logger:Logger):
+    def __init__(self, pdf_path:str, logger:Logger, pdf_converter:PDFConverter=None):
         """
         Initializes the ConsorbankDataFrame class with the provided PDF path,
         minimum top threshold for filtering words, and margin for defining column ranges.
 
         :param pdf_path: Path to the PDF file to be processed.
+        :param pdf_converter: Optional converter of the same file, whose already parsed pages are reused.
         """
         self.pdf_path = pdf_path
         self.logger = logger
+        self.pdf_converter = pdf_converter
         self.margin=40
         self.top_diference=4
         
@@ -34,8 +38,12 @@ class ConsorbankDataFrame:
         current_row = None
         last_top = None 
 
-        # Open the PDF file
-        with pdfplumber.open(self.pdf_path) as pdf:
+        # Reuse the PDF of the converter, its pages are already parsed; otherwise open the file
+        if self.pdf_converter:
+            pdf_context = nullcontext(self.pdf_converter.getLazyPdf())
+        else:
+            pdf_context = pdfplumber.open(self.pdf_path)
+        with pdf_context as pdf:
             for page in pdf.pages:
                 words = page.extract_words()
 
@@ -1,10 +1,12 @@
+import numpy as np
 import pandas as pd
 import re
-from typing import List, Optional
+from typing import Dict, List, Optional
 from code.model.transaction import Transaction
 from code.logger import Logger
 from .text import TextExtractor
 from .date_parser import DateParser
+from .amount_parser import AmountParser
 from .invoice import extract_and_remove_invoices
 
 class ConsorsbankDataframeMapper:
@@ -24,80 +26,120 @@ class ConsorsbankDataframeMapper:
     Then each block is mapped to a single Transaction object.
     """
     TRIGGERS = ["*** Kontostand zum", "LASTSCHRIFT", "GEBUEHREN", "EURO-UEBERW.", "GUTSCHRIFT", "DAUERAUFTRAG"]
+    # All triggers compiled into one pattern, so each row is scanned only once
+    trigger_pattern = re.compile("|".join(map(re.escape, TRIGGERS)))
+    # From this number of rows the triggers are searched in one joined buffer instead of row by row
+    BUFFER_SCAN_MIN_ROWS = 10000
+    date_pattern = re.compile(r'(\d{1,2})\.(\d{1,2})\.(\d{2,4})')
 
     def __init__(self, logger: Logger, source: str, textextractor:TextExtractor):
         self.logger = logger
         self.source = source
         self.textextractor = textextractor
         self.year = textextractor.getYear()
+        # Statement wide values, searched once instead of once per transaction
+        self.currency = textextractor.getCurrency()
+        self.account_holder = textextractor.getAccountHolder()
+        self.iban = textextractor.getIBAN()
 
     def map_transactions(self, df: pd.DataFrame) -> List[Transaction]:
         """
         Main entry point: 
         1) Split the DataFrame rows into blocks, each block ends when a new trigger is found.
         2) Map each block to a Transaction.
+
+        Each column is converted to one array up front, the blocks are then mapped
+        by row positions into these arrays instead of building row objects.
         """
+        if df.empty:
+            return []
+
+        columns = {name: df[name].astype(str).to_numpy() for name in df.columns}
         blocks = self._split_into_blocks(df)
         transactions = []
 
-        for idx, block in enumerate(blocks):
-            transaction = self._map_block_to_transaction(block)
+        # The amounts of all blocks are parsed in one go
+        first_rows = [rows[0] for rows in blocks]
+        values = AmountParser.parse_amounts(columns["Soll"][first_rows], columns["Haben"][first_rows])
+
+        for idx, (rows, value) in enumerate(zip(blocks, values)):
+            transaction = self._map_block_to_transaction(columns, rows, value)
             if transaction:
                 transactions.append(transaction)
-            else:
+            elif self.logger.is_debug():
                 # Optionally log if the block couldn't be mapped
-                self.logger.debug(f"Block {idx} could not be mapped: {[r.to_dict() for r in block]}")
+                self.logger.debug(f"Block {idx} could not be mapped: {df.iloc[rows.start:rows.stop].to_dict(orient='records')}")
 
         return transactions
 
-    def _split_into_blocks(self, df: pd.DataFrame) -> List[List[pd.Series]]:
+    def _split_into_blocks(self, df: pd.DataFrame) -> List[range]:
         """
-        Splits the DataFrame into a list of blocks (each block is a list of rows).
+        Splits the DataFrame into a list of blocks (each block is the range of its row positions).
         A new block is started whenever we encounter a trigger in 'Text/Verwendungszweck'.
+
+        The trigger rows are detected for the whole column at once, the blocks are
+        then cut between the positions of these rows.
         """
-        blocks: List[List[pd.Series]] = []
-        current_block: List[pd.Series] = []
-
-        for i, row in df.iterrows():
-            text_val = str(row.get("Text/Verwendungszweck", "")).strip()
-
-            # If we find a trigger, we finish the current block (if any) and start a new one
-            if any(trigger in text_val for trigger in self.TRIGGERS):
-                # Falls der current_block schon gefüllt ist, speichern wir ihn
-                if current_block:
-                    blocks.append(current_block)
-                # Neuer Block mit der aktuellen Zeile als Start
-                current_block = [row]
-            else:
-                # Einfach zur aktuellen Block-Liste hinzufügen
-                current_block.append(row)
-
-        # Am Ende den letzten Block noch anhängen
-        if current_block:
-            blocks.append(current_block)
-
-        return blocks
-
-    def _map_block_to_transaction(self, block: List[pd.Series]) -> Optional[Transaction]:
-        first_row = block[0]
-        text_val = str(first_row.get("Text/Verwendungszweck", "")).strip()
+        if df.empty:
+            return []
+
+        text_col = df["Text/Verwendungszweck"].astype(str)
+        if len(text_col) >= self.BUFFER_SCAN_MIN_ROWS:
+            mask = self._scan_triggers(text_col.to_numpy())
+        else:
+            mask = text_col.str.contains(self.trigger_pattern, regex=True).to_numpy()
+        starts = np.flatnonzero(mask)
+
+        # Rows before the first trigger still form a block of their own
+        if not starts.size or starts[0] != 0:
+            starts = np.insert(starts, 0, 0)
+        ends = np.append(starts[1:], len(df))
+
+        return [range(start, end) for start, end in zip(starts.tolist(), ends.tolist())]
+
+    def _scan_triggers(self, text_col: np.ndarray) -> np.ndarray:
+        """
+        Returns the trigger mask for large statements. All rows are joined into one
+        buffer, separated by NUL, and every trigger is searched through the whole
+        buffer with str.find. The found positions are mapped back to their rows.
+        """
+        buffer = "\x00".join(text_col)
+        lengths = np.fromiter(map(len, text_col), dtype=np.int64, count=len(text_col))
+        offsets = np.zeros(len(text_col), dtype=np.int64)
+        np.cumsum(lengths[:-1] + 1, out=offsets[1:])
+
+        positions = []
+        for trigger in self.TRIGGERS:
+            position = buffer.find(trigger)
+            while position != -1:
+                positions.append(position)
+                position = buffer.find(trigger, position + len(trigger))
+
+        mask = np.zeros(len(text_col), dtype=bool)
+        mask[np.searchsorted(offsets, positions, side="right") - 1] = True
+        return mask
+
+    def _map_block_to_transaction(self, columns: Dict[str, np.ndarray], rows: range, value: float) -> Optional[Transaction]:
+        first_row = rows[0]
+        text_val = columns["Text/Verwendungszweck"][first_row].strip()
         if "*** Kontostand zum" not in text_val and "Consorsbank" not in text_val:
             transaction = Transaction(self.logger, self.source)
-            transaction.posting_number = str(first_row.get("PNNr", "")).strip()
-            transaction.setValutaDate(DateParser.convert_to_iso(first_row.get("Wert",""),self.year))
-            transaction.setTransactionDate(DateParser.convert_to_iso(first_row.get("Datum", ""),self.year))
-            transaction.currency = self.textextractor.getCurrency()
-            transaction.owner.name = self.textextractor.getAccountHolder()
-            transaction.owner.id = self.textextractor.getIBAN()
+            transaction.posting_number = columns["PNNr"][first_row].strip()
+            transaction.setValutaDate(DateParser.convert_to_iso(columns["Wert"][first_row],self.year))
+            transaction.setTransactionDate(DateParser.convert_to_iso(columns["Datum"][first_row],self.year))
+            transaction.currency = self.currency
+            transaction.owner.name = self.account_holder
+            transaction.owner.id = self.iban
             transaction.owner.institute = "Consorsbank"
             transaction.type = text_val  # e.g. "LASTSCHRIFT", "GEBUEHREN", etc.
-            transaction.partner.name = str(block[1].get("Text/Verwendungszweck", "")).strip()
-            transaction.partner.institute = str(block[2].get("Text/Verwendungszweck", "")).strip()
-            transaction.description = self._get_description(block)
-            transaction.value = self._parse_value(
-                str(first_row.get("Soll", "")).strip(),
-                str(first_row.get("Haben", "")).strip()
-            ) or 0
+            transaction.partner.name = columns["Text/Verwendungszweck"][rows[1]].strip()
+            transaction.partner.institute = columns["Text/Verwendungszweck"][rows[2]].strip()
+            transaction.description = self._get_description(columns, rows)
+            soll, haben = columns["Soll"][first_row].strip(), columns["Haben"][first_row].strip()
+            if np.isnan(value) and (soll or haben):
+                self.logger.debug(f"Could not parse value from Soll '{soll}' / Haben '{haben}'")
+            # Missing and zero amounts are 0, so a zero debit does not become -0.0
+            transaction.value = 0 if np.isnan(value) or value == 0 else float(value)
             invoices, cleaned_text = extract_and_remove_invoices(transaction.description)
             if invoices:
                 transaction.description = cleaned_text
@@ -105,14 +147,14 @@ class ConsorsbankDataframeMapper:
             transaction.setTransactionId()
             return transaction
     
-    def _get_description(self,block):
+    def _get_description(self, columns, rows):
         # Collect description lines from block[3] onward
         description_lines = []
-        for row in block[3:]:
+        for row in rows[3:]:
             # Gather the non-empty values from all columns in this row
             row_parts = []
-            for col_name, col_val in row.items():
-                val_str = str(col_val).strip()
+            for column in columns.values():
+                val_str = column[row].strip()
                 if val_str:
                     row_parts.append(val_str)
             
@@ -132,7 +174,7 @@ class ConsorsbankDataframeMapper:
         Converts a date like '31.10.22' to '2022-10-31'.
         If parsing fails, returns the original string or logs a debug message.
         """
-        match = re.match(r'(\d{1,2})\.(\d{1,2})\.(\d{2,4})', date_str)
+        match = self.date_pattern.match(date_str)
         if match:
             day, month, year = match.groups()
             if len(year) == 2:
@@ -141,18 +183,3 @@ class ConsorsbankDataframeMapper:
         else:
             self.logger.debug(f"Could not parse date from '{date_str}'")
             return date_str
-
-    def _parse_value(self, soll_str: str, haben_str: str) -> Optional[float]:
-        if soll_str:
-            val_str = soll_str.replace('.', '').replace(',', '.').replace('-', '')
-            try:
-                return -float(val_str)
-            except ValueError:
-                self.logger.debug(f"Could not parse soll value from '{soll_str}'")
-        elif haben_str:
-            val_str = haben_str.replace('.', '').replace(',', '.').replace('+', '')
-            try:
-                return float(val_str)
-            except ValueError:
-                self.logger.debug(f"Could not parse haben value from '{haben_str}'")
-        return None
@@ -16,7 +16,7 @@ class ConsorsbankPDFExtractor(PDFExtractor):
         self.previous_balance = None
         self.transactions = None
         textextractor = TextExtractor(self.logger,self.pdf_converter.getLazyFullText())
-        dataframe = ConsorbankDataFrame(self.source,self.logger)
+        dataframe = ConsorbankDataFrame(self.source,self.logger,self.pdf_converter)
         dataframe_mapper = ConsorsbankDataframeMapper(self.logger,self.source,textextractor)
         self.transactions = dataframe_mapper.map_transactions(dataframe.extract_data())
     
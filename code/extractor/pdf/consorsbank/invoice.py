@@ -1,6 +1,13 @@
 import re
 from typing import List, Tuple
 
+# Regex to capture the invoice number (group 1),
+# while also matching the entire phrase (keyword + number).
+INVOICE_EXTRACTION_PATTERN = re.compile(r'(?:Rechnungsnr\.?:|Rechnungsnummer:|Rechnung|Rechnungs-Nr\.?:)\s*(\S+)')
+
+# Matches the entire chunk (keyword + whitespace + invoice number) without capturing groups.
+INVOICE_REMOVAL_PATTERN = re.compile(r'(?:Rechnungsnr\.?:|Rechnungsnummer:|Rechnung|Rechnungs-Nr\.?:)\s*\S+')
+
 def extract_and_remove_invoices(text: str) -> Tuple[List[str], str]:
     """
     1) Finds any of these keywords in 'text':
@@ -19,19 +26,10 @@ def extract_and_remove_invoices(text: str) -> Tuple[List[str], str]:
         - new_text: the original text with those matches removed
     """
 
-    # Regex to capture the invoice number (group 1),
-    # while also matching the entire phrase (keyword + number).
-    # We use a look-behind style approach with parentheses around (\\S+),
-    # but for removing, we'll do a second pattern that matches the entire chunk.
-    pattern_for_extraction = r'(?:Rechnungsnr\.?:|Rechnungsnummer:|Rechnung|Rechnungs-Nr\.?:)\s*(\S+)'
-
     # 1) Extract all invoice numbers (the part after the keyword).
-    invoice_list = re.findall(pattern_for_extraction, text)
+    invoice_list = INVOICE_EXTRACTION_PATTERN.findall(text)
 
     # 2) Remove the entire matched segment (keyword + invoice number).
-    #    We just remove everything matched by a slightly simpler pattern
-    #    that does not capture groups, but includes the keyword + whitespace + invoice number.
-    pattern_for_removal = r'(?:Rechnungsnr\.?:|Rechnungsnummer:|Rechnung|Rechnungs-Nr\.?:)\s*\S+'
-    new_text = re.sub(pattern_for_removal, '', text)
+    new_text = INVOICE_REMOVAL_PATTERN.sub('', text)
 
     return invoice_list, new_text
\ No newline at end of file
@@ -2,12 +2,19 @@ from code.logger import Logger
 import re
 
 class TextExtractor:
+    iban_pattern = re.compile(r"(DE[0-9A-Z]{20})")
+    account_holder_pattern = re.compile(r"Kontoinhaber\s+(\S+)")
+    camel_case_pattern = re.compile(r'([a-z])([A-Z])')
+    date_pattern = re.compile(r"(Datum\s+\d{2}\.\d{2}\.\d{2})")
+    year_pattern = re.compile(r"Datum\s+(\d{2})\.(\d{2})\.(\d{2,4})")
+    currency_pattern = re.compile(r"Kontow\S*hrung\s+([A-Z]{3})")
+
     def __init__(self, logger: Logger, text:str):
         self.text = text
         self.logger = logger
 
     def getIBAN(self)->str:
-        match_iban =  re.search(r"(DE[0-9A-Z]{20})", self.text)
+        match_iban =  self.iban_pattern.search(self.text)
         if match_iban:
             return match_iban.group(1)
             print("IBAN:", iban)
@@ -16,17 +23,17 @@ class TextExtractor:
     def getAccountHolder(self)->str:
         # Extract the account holder (Kontoinhaber) and insert a space before uppercase letters
         #    We look for "Kontoinhaber " followed by one non-whitespace string.
-        match_inhaber = re.search(r"Kontoinhaber\s+(\S+)", self.text)
+        match_inhaber = self.account_holder_pattern.search(self.text)
         if match_inhaber:
             raw_name = match_inhaber.group(1)  # e.g., "KevinVeen-Birkenbach"
             # Insert a space wherever a lowercase letter ([a-z]) is directly followed by an uppercase letter ([A-Z]).
-            return re.sub(r'([a-z])([A-Z])', r'\1 \2', raw_name)
+            return self.camel_case_pattern.sub(r'\1 \2', raw_name)
         self.logger.error("No account holder found.")
 
     def getDate(self)->str:
         # Extract the date
         #    Searches for "Datum " followed by DD.MM.YY
-        match_datum = re.search(r"(Datum\s+\d{2}\.\d{2}\.\d{2})", self.text)
+        match_datum = self.date_pattern.search(self.text)
         if match_datum:
             return match_datum.group(1)
         self.logger.error("No date found.")
@@ -38,7 +45,7 @@ class TextExtractor:
         Returns the four-digit year as a string, or logs an error if not found.
         """
         # This regex captures day, month, and year (either 2 or 4 digits).
-        match_date = re.search(r"Datum\s+(\d{2})\.(\d{2})\.(\d{2,4})", self.text)
+        match_date = self.year_pattern.search(self.text)
         if match_date:
             day, month, year = match_date.groups()
             # If the year is only two digits, convert to four digits
@@ -49,7 +56,7 @@ class TextExtractor:
         return None
 
     def getCurrency(self)->str:
-        match_currency = re.search(r"Kontow\S*hrung\s+([A-Z]{3})", self.text)
+        match_currency = self.currency_pattern.search(self.text)
         if match_currency:
             return match_currency.group(1)
         self.logger.error("No currency found.")
\ No newline at end of file
@@ -30,10 +30,7 @@ class IngPDFExtractor(PDFExtractor):
             return []
         
         # Gesamten PDF-Text lesen, um die IBAN zu finden
-        full_text = ""
-        for page in self.pdf_converter.getLazyPages():
-            page_text = page.extract_text() or ""
-            full_text += page_text + "\n"
+        full_text = self.pdf_converter.getLazyFullText()
             
         # IBAN extrahieren mithilfe des IBAN-Parsers
         account_iban = self.iban_parser.extract(full_text)
@@ -42,8 +39,8 @@ class IngPDFExtractor(PDFExtractor):
             
         # Transaktionen seitenweise parsen
         builder = TransactionBuilder(self.logger, self.source, account_iban)
-        for page in self.pdf_converter.getLazyPages():
-            lines = page.extract_text().splitlines()
+        for page_text in self.pdf_converter.getLazyPageTexts():
+            lines = page_text.splitlines()
             i = 0
             while i < len(lines):
                 line = lines[i].strip()
@@ -1,8 +1,19 @@
 import os
+import re
 import importlib
+import functools
 from pdfminer.high_level import extract_text
 from code.converter.pdf import PDFConverter
 
+@functools.lru_cache(maxsize=32)
+def _select_extractor_class(module_name, class_name):
+    """
+    Imports the extractor module and returns the extractor class.
+    Cached, because all files of the same type and bank use the same class.
+    """
+    module = importlib.import_module(module_name)
+    return getattr(module, class_name)
+
 class ExtractorFactory:
     """
     Factory class that decides which extractor to use for a given file
@@ -13,22 +24,27 @@ class ExtractorFactory:
         self.config = config or {}
         
         # Mappings for CSV-based extractors:
-        # Each entry is: (condition_func, module_name, class_name)
-        # condition_func receives a string containing the first ~10 lines
+        # Each entry is: (markers, name)
+        # The markers are searched as bytes in the head of the file
         self.csv_extractor_mappings = [
             (
-                lambda content: "Transaktionscode" in content or "PayPal" in content,
+                (b"Transaktionscode", b"PayPal"),
                 "PayPal",
             ),
             (
-                lambda content: "Buchungsdatum" in content,
+                (b"Buchungsdatum",),
                 "DKB", 
             ),
         ]
 
+        # Number of bytes read from the head of a CSV file to detect patterns
+        self.csv_sniff_bytes = 4096
+        # Only the first lines are searched, rows further down may name PayPal as partner
+        self.csv_sniff_lines = 10
+
         # Mappings for PDF-based extractors:
-        # Each entry is: (condition_func, module_name, class_name)
-        # condition_func receives (text, lower_text)
+        # Each entry is: (markers, name)
+        # The markers are searched case-insensitively in the page text
         self.pdf_extractor_mappings = [
  #           (
  #               lambda text, lower_text: "paypal" in lower_text
@@ -37,19 +53,30 @@ class ExtractorFactory:
  #               "PayPal"
  #           ),
             (
-                lambda text, lower_text: "ing-diba" in lower_text or "ingddeffxxx" in lower_text,
+                ("ing-diba", "ingddeffxxx"),
                 "Ing"
             ),
             (
-                lambda text, lower_text: "consorsbank" in lower_text or "kontoauszug" in lower_text,
+                ("consorsbank", "kontoauszug"),
                 "Consorsbank",
             ),
             (
-                lambda text, lower_text: "barclaycard" in lower_text or "barcdehaxx" in lower_text,
+                ("barclaycard", "barcdehaxx"),
                 "Barclays"
             ),
         ]
 
+        # All markers of a file type compiled into one pattern, so the content is scanned only once
+        self.csv_sniffer = re.compile(b"|".join(
+            re.escape(marker) for markers, _ in self.csv_extractor_mappings for marker in markers
+        ))
+        self.pdf_sniffer = re.compile("|".join(
+            re.escape(marker) for markers, _ in self.pdf_extractor_mappings for marker in markers
+        ), re.IGNORECASE)
+
+        # Number of PDF pages scanned for a bank marker before giving up
+        self.pdf_sniff_max_pages = 3
+
     def create_extractor(self, file_path):
         """
         Chooses and instantiates the correct extractor based on the file extension
@@ -59,31 +86,26 @@ class ExtractorFactory:
 
         # Handle CSV
         if file_type == ".csv":
-            with open(file_path, encoding="utf-8") as f:
-                # Read first ~10 lines to detect patterns
-                lines = [f.readline() for _ in range(10)]
-            content = " ".join(lines)
+            with open(file_path, "rb") as f:
+                # Read the head of the file in one go to detect patterns
+                content = f.read(self.csv_sniff_bytes)
+            content = b"\n".join(content.split(b"\n", self.csv_sniff_lines)[:self.csv_sniff_lines])
 
-            # Go through each CSV mapping
-            for condition_func, name in self.csv_extractor_mappings:
-                if condition_func(content):
-                    return self._instantiate_extractor(name, file_type, file_path)
+            name = self._match_mapping(self.csv_extractor_mappings, set(self.csv_sniffer.findall(content)))
+            if name:
+                return self._instantiate_extractor(name, file_type, file_path)
             self.logger.info(f"No matching CSV extractor found for '{file_path}'.")
             return None
 
         # Handle PDF
         elif file_type == ".pdf":
             pdf_converter = PDFConverter(self.logger, file_path);
-            
-            first_page_text = pdf_converter.getFirstPage()
-            if first_page_text:
-                lower_first_page_text = first_page_text.lower()
-            else:
-                return None
 
-            # Go through each PDF mapping
-            for condition_func, name in self.pdf_extractor_mappings:
-                if condition_func(first_page_text, lower_first_page_text):      
+            # Stream the pages and stop at the first one that contains a bank marker
+            for page_text in pdf_converter.iterPageTexts(maxpages=self.pdf_sniff_max_pages):
+                found = {marker.lower() for marker in self.pdf_sniffer.findall(page_text)}
+                name = self._match_mapping(self.pdf_extractor_mappings, found)
+                if name:
                     return self._instantiate_extractor(name, file_type, file_path, pdf_converter)
             self.logger.info(f"No matching PDF extractor found for '{file_path}'.")
             return None
@@ -93,6 +115,17 @@ class ExtractorFactory:
             self.logger.info(f"Unsupported file extension '{ext}' for {file_path}.")
             return None
 
+    @staticmethod
+    def _match_mapping(mappings, found):
+        """
+        Returns the name of the first mapping with a marker among the found ones.
+        The order of the mappings decides if markers of several extractors were found.
+        """
+        for markers, name in mappings:
+            if not found.isdisjoint(markers):
+                return name
+        return None
+
     def _instantiate_extractor(self, name, file_type, file_path, pdf_converter=None):
         module_name = f"code.extractor.{file_type.lower().replace(".", "")}.{name.lower()}.extractor"
         class_name = f"{name}{file_type.upper().replace(".", "")}Extractor"
@@ -101,8 +134,7 @@ class ExtractorFactory:
         """
         try:
             # Assuming the extractor modules are in the same package directory:
-            module = importlib.import_module(f"{module_name}")
-            extractor_class = getattr(module, class_name)
+            extractor_class = _select_extractor_class(module_name, class_name)
             # If your extractor needs a logger, pass it here as well
             if pdf_converter:
                 return extractor_class(file_path, logger=self.logger, config=self.config, pdf_converter=pdf_converter)
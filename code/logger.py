@@ -31,11 +31,25 @@ class Logger:
             return
         print(f"{self.RED}[ERROR]{self.RESET} {message}")
 
+    def is_debug(self):
+        """Lets callers skip building expensive debug messages that would not be printed."""
+        return self.debug_enabled and not self.quiet
+
     def debug(self, message):
         if self.quiet or not self.debug_enabled:
             return
         print(f"{self.PINK}[DEBUG]{self.RESET} {message}")
 
+    def get_counts(self):
+        return (self.warnings_count, self.success_count, self.error_count)
+
+    def add_counts(self, counts):
+        """Adds counts collected by another logger, e.g. the copy used in a worker process."""
+        warnings_count, success_count, error_count = counts
+        self.warnings_count += warnings_count
+        self.success_count += success_count
+        self.error_count += error_count
+
     def success(self, message):
         self.success_count += 1
         if self.quiet:
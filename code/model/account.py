@@ -1,12 +1,22 @@
 from code.logger import Logger
 
 class Account:
+    __slots__ = ("logger", "id", "name", "institute")
+
     def __init__(self, logger:Logger, id=None, name=None, institute=None):
         self.logger = logger        # Logger class
         self.id = id                # ID of the account like IBAN
         self.name = name            # Owner of the Account like Max Mustermann
         self.institute = institute  # The institute the account belongs to  
 
+    def __getstate__(self)-> dict:
+        # Plain attribute mapping, so pickle and the YAML export see the same state as without __slots__
+        return {key: getattr(self, key) for key in Account.__slots__ if hasattr(self, key)}
+
+    def __setstate__(self, state:dict)->None:
+        for key, value in state.items():
+            setattr(self, key, value)
+
     def isValid(self)->bool:
         if bool(self.id or self.name or self.institute):
             return True
@@ -32,6 +42,8 @@ class Account:
         return ""
     
 class OwnerAccount(Account):
+    __slots__ = ()
+
     # Verifies if accout is valid
     def isValid(self)->bool:
         if bool((self.id or self.name) and self.institute):
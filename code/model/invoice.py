@@ -1,4 +1,6 @@
 class Invoice:
+    __slots__ = ("id", "document", "customer_reference", "creditor_id", "mandate_reference")
+
     def __init__(
         self,
         id: str = None,                 # Unique identifier for the invoice
@@ -13,9 +15,17 @@ class Invoice:
         self.creditor_id = creditor_id
         self.mandate_reference = mandate_reference
         
+    def __getstate__(self)-> dict:
+        # Plain attribute mapping, so pickle and the YAML export see the same state as without __slots__
+        return {key: getattr(self, key) for key in self.__slots__ if hasattr(self, key)}
+
+    def __setstate__(self, state:dict)->None:
+        for key, value in state.items():
+            setattr(self, key, value)
+
     # Verifies if invoice is valid
     def isValid(self):
         return True
     
     def getDictionary(self):
-        return self.__dict__.copy()
+        return {key: getattr(self, key) for key in self.__slots__}
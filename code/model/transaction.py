@@ -10,6 +10,27 @@ from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
 class Transaction:
     """Represents a single transaction."""
+    # Fixed attributes instead of a per instance __dict__, transactions are created in bulk
+    __slots__ = (
+        "logger",
+        "description",
+        "value",
+        "owner",
+        "partner",
+        "source",
+        "currency",
+        "invoice",
+        "date",
+        "id",
+        "related_transaction_id",
+        "valuta_date",
+        "type",
+        "medium",
+        "posting_number",
+        "finance_institute",    # Only set by the PayPal extractor
+        "_dictionary",          # Cache of the dictionary property
+    )
+
     def __init__(self, 
                  logger:Logger, 
                  source:str, 
@@ -34,7 +55,14 @@ class Transaction:
         self.type                   = None
         self.medium                 = None
         self.posting_number         = None
+        self._dictionary            = None
         
+    def setLogger(self, logger:Logger)->None:
+        """Rebinds the logger, e.g. after the transaction was sent back from a worker process."""
+        self.logger         = logger
+        self.owner.logger   = logger
+        self.partner.logger = logger
+
     def setValutaDate(self, date_string):
         """
         Similar to setTransactionDate, but for Valuta (value date).
@@ -224,10 +252,23 @@ class Transaction:
         
         return dictionary
 
+    @property
+    def dictionary(self)-> dict:
+        """
+        getDictionary() built once and cached. Only use it once the transaction
+        is complete, later changes to its attributes are not reflected.
+        """
+        if self._dictionary is None:
+            self._dictionary = self.getDictionary()
+        return self._dictionary
+
     def __str__(self)->str:
         output = ""
-        data = self.__dict__
-        for key, value in data.items():
+        for key in self.__slots__:
+            # Skip internal caches and attributes that were never set
+            if key.startswith("_") or not hasattr(self, key):
+                continue
+            value = getattr(self, key)
             value_str = value if value is not None else "N/A"
             output += f"{key.replace('_', ' ').title()}: {value_str} \n"
         return output
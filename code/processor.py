@@ -1,14 +1,100 @@
 import os
 import concurrent.futures
+from datetime import date
+import numpy as np
 from .logger import Logger
 from .factories.extractor import ExtractorFactory
 from .model.transaction import Transaction
 from code.validator.transaction import TransactionValidator
+from .exporter.csv import CSVExporter
+from .exporter.html import HTMLExporter
+from .exporter.json import JSONExporter
+from .exporter.yaml import YamlExporter
+
+# Below this number of files the startup of worker processes costs more than it saves
+PROCESS_POOL_MIN_FILES = 4
+
+# Exporter class for each export type
+EXPORTERS = {
+    "csv": CSVExporter,
+    "html": HTMLExporter,
+    "json": JSONExporter,
+    "yaml": YamlExporter,
+}
+
+# Extensions of the files transactions can be extracted from
+_VALID_EXTS = frozenset(("pdf", "csv"))
+
+_worker_logger = None
+_worker_factory = None
+
+def _extract(file_path, extractor_factory):
+    extractor = extractor_factory.create_extractor(file_path)
+    if extractor:
+        return extractor.extract_transactions()
+    else:
+        return []
+
+def _init_worker(logger, config):
+    """Builds the extractor factory once for all files handled by a worker process."""
+    global _worker_logger, _worker_factory
+    _worker_logger = logger
+    _worker_factory = ExtractorFactory(logger, config=config)
+
+def _extract_in_worker(file_path):
+    """
+    Extracts the transactions of one file inside a worker process.
+    The worker only holds a copy of the logger, so the counts it added are returned as well.
+    """
+    counts_before = _worker_logger.get_counts()
+    transactions = _extract(file_path, _worker_factory)
+    counts = tuple(after - before for after, before in zip(_worker_logger.get_counts(), counts_before))
+    return transactions, counts
+
+def _has_valid_extension(file_name):
+    _, dot, extension = file_name.rpartition(".")
+    return bool(dot) and extension.lower() in _VALID_EXTS
+
+def _scan_files(path, recursive):
+    """
+    Yields the PDF/CSV files of a directory like os.walk would, files first and then
+    the subdirectories. os.scandir already knows the type of each entry, so no extra
+    stat call is needed per file.
+    """
+    subdirectories = []
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                subdirectories.append(entry.path)
+            elif entry.is_file() and _has_valid_extension(entry.name):
+                yield entry.path
+    if recursive:
+        for subdirectory in subdirectories:
+            try:
+                yield from _scan_files(subdirectory, recursive)
+            except OSError:
+                # Unreadable subdirectories are skipped, as os.walk does
+                continue
+
+def _first_day(value):
+    """
+    Returns the first day of an ISO date (YYYY-MM-DD), month (YYYY-MM) or year (YYYY)
+    and whether the value names a single day. Raises ValueError for anything else.
+    """
+    parts = value.strip().split("-")
+    if not 1 <= len(parts) <= 3 or [len(part) for part in parts] != [4, 2, 2][:len(parts)] \
+            or not all(part.isdigit() for part in parts):
+        raise ValueError(f"'{value}' is not a date in the format YYYY-MM-DD, YYYY-MM or YYYY")
+    year, month, day = (list(map(int, parts)) + [1, 1])[:3]
+    try:
+        return date(year, month, day), len(parts) == 3
+    except ValueError as e:
+        raise ValueError(f"'{value}' is not a valid date: {e}") from e
 
 class TransactionProcessor:
     def __init__(self, input_paths, output_base, print_transactions=False, recursive=False, export_types=None,
                  from_date=None, to_date=None, create_dirs=False, quiet=False, logger=Logger(),
-                 print_cmd=False, config=None, validate=False):
+                 print_cmd=False, config=None, validate=False, workers=None):
         self.input_paths = input_paths
         self.output_base = output_base
         self.all_transactions = []
@@ -23,42 +109,77 @@ class TransactionProcessor:
         self.logger = logger
         self.config = config or {}
         self.validate = validate
+        self.workers = workers or max(1, (os.cpu_count() or 1) - 1)
+        self._factory = ExtractorFactory(self.logger, config=self.config)
+        self._from_day, self._to_day, self._valid_date_range = self._parse_date_range()
 
     def extract_from_file(self, file_path):
-        extractor_factory = ExtractorFactory(self.logger, config=self.config)
-        extractor = extractor_factory.create_extractor(file_path)
-        if extractor:
-            return extractor.extract_transactions()
+        return _extract(file_path, self._factory)
+
+    def _extract_all(self, file_paths):
+        """
+        Extracts the transactions of all files. The parsing is CPU bound, so it runs
+        in worker processes; small jobs stay in threads of this process.
+        """
+        if self.workers > 1 and len(file_paths) >= PROCESS_POOL_MIN_FILES:
+            with concurrent.futures.ProcessPoolExecutor(
+                max_workers=self.workers,
+                initializer=_init_worker,
+                initargs=(self.logger, self.config),
+            ) as executor:
+                for transactions, counts in executor.map(_extract_in_worker, file_paths):
+                    self.logger.add_counts(counts)
+                    for transaction in transactions:
+                        transaction.setLogger(self.logger)
+                    self.all_transactions.extend(transactions)
         else:
-            return []
+            with concurrent.futures.ThreadPoolExecutor() as executor:
+                for transactions in executor.map(self.extract_from_file, file_paths):
+                    self.all_transactions.extend(transactions)
+
+    def _parse_date_range(self):
+        """
+        Converts --from/--to into day ordinals once. A year or month works as a prefix,
+        like the former comparison of the date strings: --from 2023 starts on 2023-01-01,
+        --to 2023 ends before it. Returns the bounds (None if not given) and their validity.
+        """
+        from_day = to_day = None
+        try:
+            if self.from_date:
+                from_day = _first_day(self.from_date)[0].toordinal()
+            if self.to_date:
+                day, is_single_day = _first_day(self.to_date)
+                to_day = day.toordinal() if is_single_day else day.toordinal() - 1
+        except ValueError as e:
+            self.logger.error(f"Invalid date range: {e}")
+            return None, None, False
+        return from_day, to_day, True
 
     def _filter_by_date(self):
         if self.from_date or self.to_date:
-            filtered = []
-            for transaction in self.all_transactions:
-                if self.from_date and transaction.getDictionary().get("date") < self.from_date:
-                    continue
-                if self.to_date and transaction.getDictionary().get("date") > self.to_date:
-                    continue
-                filtered.append(transaction)
-            self.all_transactions = filtered
+            # Calendar days as ordinals; a timezone aware datetime keeps its local date
+            days = np.fromiter(
+                (transaction.date.toordinal() for transaction in self.all_transactions),
+                dtype=np.int64,
+                count=len(self.all_transactions),
+            )
+            mask = np.ones(len(days), dtype=bool)
+            if self._from_day is not None:
+                mask &= days >= self._from_day
+            if self._to_day is not None:
+                mask &= days <= self._to_day
+            self.all_transactions = [
+                transaction for transaction, keep in zip(self.all_transactions, mask) if keep
+            ]
         
     def process(self):
+        if not self._valid_date_range:
+            return
         pdf_csv_files = []
         for path in self.input_paths:
             if os.path.isdir(path):
-                if self.recursive:
-                    for root, _, files in os.walk(path):
-                        for file_name in files:
-                            if file_name.lower().endswith((".pdf", ".csv")):
-                                pdf_csv_files.append(os.path.join(root, file_name))
-                else:
-                    pdf_csv_files.extend([
-                        os.path.join(path, file_name)
-                        for file_name in os.listdir(path)
-                        if file_name.lower().endswith((".pdf", ".csv"))
-                    ])
-            elif os.path.isfile(path) and path.lower().endswith((".pdf", ".csv")):
+                pdf_csv_files.extend(_scan_files(path, self.recursive))
+            elif os.path.isfile(path) and _has_valid_extension(path):
                 pdf_csv_files.append(path)
             else:
                 self.logger.warning(f"Invalid input path: {path}")
@@ -67,10 +188,7 @@ class TransactionProcessor:
             return
         self.logger.info(f"Found {len(pdf_csv_files)} files.")
 
-        with concurrent.futures.ThreadPoolExecutor() as executor:
-            results = list(executor.map(self.extract_from_file, pdf_csv_files))
-            for transactions in results:
-                self.all_transactions.extend(transactions)
+        self._extract_all(pdf_csv_files)
 
         self._filter_by_date();
         
@@ -92,22 +210,14 @@ class TransactionProcessor:
             if self.create_dirs:
                 os.makedirs(os.path.dirname(output_file), exist_ok=True)
 
-            if fmt == "csv":
-                from .exporter.csv import CSVExporter
-                exporter = CSVExporter(self.all_transactions, output_file)
-                exporter.export()
-            elif fmt == "html":
-                from .exporter.html import HTMLExporter
+            exporter_class = EXPORTERS.get(fmt)
+            if exporter_class is HTMLExporter:
                 exporter = HTMLExporter(self.all_transactions, output_file, from_date=self.from_date, to_date=self.to_date)
-                exporter.export()
-            elif fmt == "json":
-                from .exporter.json import JSONExporter
-                exporter = JSONExporter(self.all_transactions, output_file)
-                exporter.export()
-            elif fmt == "yaml":
-                from .exporter.yaml import YamlExporter
-                exporter = YamlExporter(self.all_transactions, output_file)
-                exporter.export()
+            elif exporter_class:
+                exporter = exporter_class(self.all_transactions, output_file)
+            else:
+                continue
+            exporter.export()
         if self.print_transactions:
             self.console_output()
 
@@ -0,0 +1,44 @@
+import unittest
+import numpy as np
+import pandas as pd
+from code.logger import Logger
+from code.extractor.pdf.consorsbank.text import TextExtractor
+from code.extractor.pdf.consorsbank.dataframe_mapper import ConsorsbankDataframeMapper
+
+STATEMENT_TEXT = "Kontoinhaber MaxMustermann DE12345678901234567890 Datum 30.12.22 Kontowährung EUR"
+
+class TestScanTriggers(unittest.TestCase):
+    """The buffer scan for large statements has to find the same rows as str.contains."""
+
+    def setUp(self):
+        logger = Logger(quiet=True)
+        self.mapper = ConsorsbankDataframeMapper(logger, "statement.pdf", TextExtractor(logger, STATEMENT_TEXT))
+
+    def assertMatchesContains(self, rows):
+        text_col = pd.Series(rows, dtype=str)
+        expected = text_col.str.contains(self.mapper.trigger_pattern, regex=True).to_numpy()
+        np.testing.assert_array_equal(self.mapper._scan_triggers(text_col.to_numpy()), expected)
+
+    def test_no_trigger(self):
+        self.assertMatchesContains(["Max Mustermann", "Musterbank", "", "Miete Januar"])
+
+    def test_trigger_in_first_and_last_row(self):
+        self.assertMatchesContains(["LASTSCHRIFT", "Stadtwerke", "Strom 12/2022", "", "GUTSCHRIFT"])
+
+    def test_mixed_rows(self):
+        rows = []
+        for index in range(200):
+            trigger = ConsorsbankDataframeMapper.TRIGGERS[index % len(ConsorsbankDataframeMapper.TRIGGERS)]
+            rows += [f"{trigger} {index}", "Partner", "", f"Verwendungszweck mit {trigger[:3]}"]
+        rows += ["*** Kontostand zum 30.12.2022", "EURO-UEBERW.DAUERAUFTRAG"]
+        self.assertMatchesContains(rows)
+
+    def test_split_into_blocks_uses_buffer_scan_for_large_tables(self):
+        rows = ["LASTSCHRIFT", "Stadtwerke", "Strom"] * (ConsorsbankDataframeMapper.BUFFER_SCAN_MIN_ROWS // 3 + 1)
+        df = pd.DataFrame({"Text/Verwendungszweck": rows})
+        blocks = self.mapper._split_into_blocks(df)
+        self.assertEqual(len(blocks), len(rows) // 3)
+        self.assertEqual(blocks[-1], range(len(rows) - 3, len(rows)))
+
+if __name__ == "__main__":
+    unittest.main()
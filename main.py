@@ -22,6 +22,7 @@ def main():
     parser.add_argument("--print-cmd", action="store_true", help="Print constructed CMD commands before execution.")
     parser.add_argument("--config", type=str, help="Path to a YAML config file with default values.")
     parser.add_argument("--validate", action="store_true", help="Enable validation based on config.")
+    parser.add_argument("--workers", type=int, help="Number of worker processes for the extraction (default: CPU count minus one).")
     
     args = parser.parse_args()
 
@@ -54,6 +55,7 @@ def main():
         print_cmd=args.print_cmd,
         config=config_data,
         validate=args.validate, 
+        workers=args.workers,
     )
     processor.process()
     